@@ -20,7 +20,9 @@ from nexussdk import realms
 from nexussdk import views
 
 from nexussdk.utils import tools
+from nexussdk.utils.batch import pipeline
 
 # Expose this error so that a user of the nexus sdk can refer to it as nexussdk.HTTPError
 # and does not have to figure out from what lib it comes from
 from requests.exceptions import HTTPError
+from nexussdk.utils.http import NexusHTTPError
@@ -4,9 +4,10 @@ It is part of the Identity & Access Management API of Blue Brain Nexus v1.
 https://bluebrain.github.io/nexus/docs/api/iam/iam-acls-api.html
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-from nexussdk.utils.http import http_delete, http_get, http_patch, http_put, sse_request
+from nexussdk.utils.batch import run_concurrently
+from nexussdk.utils.http import encode_json, http_delete, http_get, http_patch, http_put, sse_request
 
 SEGMENT = "acls"
 
@@ -23,7 +24,7 @@ def fetch(subpath: str, rev: int = None, self: bool = True) -> Dict:
         ACLs on the current subpath are returned.
     :return: A Nexus results list with the Nexus payloads of the ACLs.
     """
-    return http_get([SEGMENT, subpath], rev=rev, self=self)
+    return http_get((SEGMENT, subpath), rev=rev, self=self)
 
 
 def fetch_(path: str, rev: int = None, self: bool = True) -> Dict:
@@ -51,7 +52,7 @@ def list(subpath: str, ancestors: bool = False, self: bool = True) -> Dict:
         ACLs on the current subpath are returned.
     :return: A Nexus results list with the Nexus payloads of the ACLs.
     """
-    return http_get([SEGMENT, subpath], ancestors=ancestors, self=self)
+    return http_get((SEGMENT, subpath), ancestors=ancestors, self=self)
 
 
 def list_(path: str, ancestors: bool = False, self: bool = True) -> Dict:
@@ -82,8 +83,8 @@ def replace(subpath: str, permissions: List[List[str]], identities: List[Dict],
     :param rev: Last revision of the ACLs.
     :return: The Nexus metadata of the ACLs.
     """
-    payload = _payload(permissions, identities)
-    return http_put([SEGMENT, subpath], payload, rev=rev)
+    body = _body(permissions, identities)
+    return http_put((SEGMENT, subpath), body, rev=rev)
 
 
 def replace_(path: str, payload: Dict, rev: int) -> Dict:
@@ -108,8 +109,8 @@ def append(subpath: str, permissions: List[List[str]], identities: List[Dict], r
     :param rev: Last revision of the ACLs.
     :return: The Nexus metadata of the ACLs.
     """
-    payload = _payload(permissions, identities, "Append")
-    return http_patch([SEGMENT, subpath], payload, rev=rev)
+    body = _body(permissions, identities, "Append")
+    return http_patch((SEGMENT, subpath), body, rev=rev)
 
 
 def append_(path: str, payload: Dict, rev: int) -> Dict:
@@ -134,8 +135,8 @@ def subtract(subpath: str, permissions: List[List[str]], identities: List[Dict],
     :param rev: Last revision of the ACLs.
     :return: The Nexus metadata of the ACLs.
     """
-    payload = _payload(permissions, identities, "Subtract")
-    return http_patch([SEGMENT, subpath], payload, rev=rev)
+    body = _body(permissions, identities, "Subtract")
+    return http_patch((SEGMENT, subpath), body, rev=rev)
 
 
 def subtract_(path: str, payload: Dict, rev: int) -> Dict:
@@ -149,6 +150,42 @@ def subtract_(path: str, payload: Dict, rev: int) -> Dict:
     return http_patch(path, payload, rev=rev)
 
 
+def replace_many(items: List[Tuple[str, List[List[str]], List[Dict], int]], max_workers: int = 16) -> List[Dict]:
+    """Replace ACLs on many subpaths, sending the requests concurrently.
+
+    :param items: List of ``(subpath, permissions, identities, rev)``, the
+        arguments of ``replace`` for each subpath.
+    :param max_workers: (optional) Maximum number of requests sent at once.
+    :return: The Nexus metadata of the ACLs, in the same order as ``items``.
+        If a request failed, its exception is at its index instead.
+    """
+    return run_concurrently(replace, items, max_workers)
+
+
+def append_many(items: List[Tuple[str, List[List[str]], List[Dict], int]], max_workers: int = 16) -> List[Dict]:
+    """Append ACLs on many subpaths, sending the requests concurrently.
+
+    :param items: List of ``(subpath, permissions, identities, rev)``, the
+        arguments of ``append`` for each subpath.
+    :param max_workers: (optional) Maximum number of requests sent at once.
+    :return: The Nexus metadata of the ACLs, in the same order as ``items``.
+        If a request failed, its exception is at its index instead.
+    """
+    return run_concurrently(append, items, max_workers)
+
+
+def subtract_many(items: List[Tuple[str, List[List[str]], List[Dict], int]], max_workers: int = 16) -> List[Dict]:
+    """Subtract ACLs on many subpaths, sending the requests concurrently.
+
+    :param items: List of ``(subpath, permissions, identities, rev)``, the
+        arguments of ``subtract`` for each subpath.
+    :param max_workers: (optional) Maximum number of requests sent at once.
+    :return: The Nexus metadata of the ACLs, in the same order as ``items``.
+        If a request failed, its exception is at its index instead.
+    """
+    return run_concurrently(subtract, items, max_workers)
+
+
 # Delete functions.
 
 def delete(subpath: str, rev: int) -> Dict:
@@ -158,7 +195,7 @@ def delete(subpath: str, rev: int) -> Dict:
     :param rev: Last revision of the ACLs.
     :return: The Nexus metadata of the ACLs.
     """
-    return http_delete([SEGMENT, subpath], rev=rev)
+    return http_delete((SEGMENT, subpath), rev=rev)
 
 
 def delete_(path: str, rev: int) -> Dict:
@@ -196,6 +233,17 @@ def _payload(permissions: List[List[str]], identities: List[Dict], operation: st
     return payload
 
 
+def _body(permissions: List[List[str]], identities: List[Dict], operation: str = None) -> bytes:
+    """Create an ACLs payload, serialized once into the JSON body of the request.
+
+    :param permissions: List of list of permissions.
+    :param identities: List of identities to which the permissions apply.
+    :param operation: (optional) Corresponding operation: "Append" or "Subtract".
+    :return: Payload of the ACLs, as JSON bytes.
+    """
+    return encode_json(_payload(permissions, identities, operation))
+
+
 def events(last_id: Optional[str] = None):
     """
     Fetches ACL related events.
@@ -4,6 +4,7 @@ The config provides an easy way to handle the Nexus environment and token.
 
 
 from nexussdk.utils.store import storage
+from nexussdk.utils.cache import fetch_cache
 
 
 def set_token(token):
@@ -13,6 +14,7 @@ def set_token(token):
     :param token: The token is a string given by Nexus or a connected service.
     """
     storage.set("token", token)
+    fetch_cache.clear()
 
 
 def remove_token():
@@ -20,6 +22,7 @@ def remove_token():
     Remove the token. Then Nexus will no longer be able to perform any operations.
     """
     storage.delete("token")
+    fetch_cache.clear()
 
 
 def set_environment(env):
@@ -30,3 +33,58 @@ def set_environment(env):
     :param env: The base URL for the environment
     """
     storage.set("environment", env)
+    fetch_cache.clear()
+
+
+def enable_request_compression(min_size=1024):
+    """
+    Compress with gzip the bodies sent to Nexus (e.g. large schemas or resources). The responses are
+    always compressed by Nexus when possible, install brotli to also accept brotli-compressed responses.
+    Enable it only if the Nexus deployment accepts gzip-encoded requests.
+
+    :param min_size: OPTIONAL The bodies smaller than this number of bytes are sent as they are (default: 1024)
+    """
+    storage.set("request_compression", min_size)
+
+
+def disable_request_compression():
+    """
+    Send the bodies to Nexus without compressing them. This is the default.
+    """
+    if storage.has("request_compression"):
+        storage.delete("request_compression")
+
+
+def enable_fast_json_parsing():
+    """
+    Parse the responses of Nexus with orjson (pip install nexus-sdk[speedups]) instead of the json module,
+    which is several times faster on large payloads.
+    Caveats: the integers wider than 64 bits are turned into floats, and would be sent back rounded by an update,
+    and the payloads are plain dictionaries instead of OrderedDict.
+    """
+    # fails now rather than on the next request if orjson is not installed
+    import orjson  # noqa: F401
+    storage.set("fast_json_parsing", True)
+
+
+def disable_fast_json_parsing():
+    """
+    Parse the responses of Nexus with the json module. This is the default.
+    """
+    if storage.has("fast_json_parsing"):
+        storage.delete("fast_json_parsing")
+
+
+def set_cache_ttl(ttl):
+    """
+    Cache the latest revisions (and the tagged ones) of the fetched projects and schemas for some time. By default,
+    only the payloads fetched for a specific revision are cached, as they cannot change.
+    An update, deprecation or tag done with the functions of projects and schemas drops the cached payloads of
+    the entity. The changes done by other clients, or through other functions (e.g. resources.update on a schema),
+    are not seen until the cached payloads expire, and an update based on them then fails with a 409 conflict.
+
+    :param ttl: Number of seconds. 0 (the default) caches only the specific revisions.
+    """
+    fetch_cache.ttl = ttl
+    if not ttl:
+        fetch_cache.clear()
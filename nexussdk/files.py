@@ -7,8 +7,6 @@ import os
 from typing import Dict, Optional
 from urllib.parse import quote_plus as url_encode
 
-import puremagic
-
 from nexussdk.utils.http import http_delete
 from nexussdk.utils.http import http_get
 from nexussdk.utils.http import http_post
@@ -403,6 +401,8 @@ def tags(file: Dict) -> Dict:
 
 def _content_type(filepath: str, content_type: Optional[str]) -> str:
     if content_type is None:
+        # puremagic is slow to import and only needed when the content type has to be guessed
+        import puremagic
         return puremagic.from_file(filepath, True)
     else:
         return content_type
@@ -2,13 +2,16 @@
 A project is a place to store data (files, resources, schemas, etc.). It belongs to an organization.
 """
 
-from nexussdk.utils.http import http_get
-from nexussdk.utils.http import http_put
-from nexussdk.utils.http import http_delete
-from nexussdk.utils.http import sse_request
-from urllib.parse import quote_plus as url_encode
+from nexussdk.utils.http import http_delete, http_get, http_put, sse_request, url_encode
+from nexussdk.utils.batch import paginate
+from nexussdk.utils.cache import fetch_cache
 from typing import Optional
 
+__all__ = ["fetch", "create", "update", "list", "list_all", "deprecate_2", "deprecate", "events"]
+
+# path of a project, from its URL-encoded organization and project labels
+_project_path = "/projects/{}/{}".format
+
 
 def fetch(org_label, project_label, rev=None):
     """
@@ -21,14 +24,20 @@ def fetch(org_label, project_label, rev=None):
     :return: All the details of this project, as a dictionary
     """
 
-    org_label = url_encode(org_label)
-    project_label = url_encode(project_label)
-    path = "/projects/" + org_label + "/" + project_label
+    path = _project_path(url_encode(org_label), url_encode(project_label))
+    cache_key = (path, rev)
+
+    cached = fetch_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    generation = fetch_cache.generation
 
     if rev is not None:
         path = path + "?rev=" + str(rev)
 
-    return http_get(path, use_base=True)
+    payload = http_get(path, use_base=True)
+    fetch_cache.set(cache_key, payload, pinned=rev is not None, generation=generation)
+    return payload
 
 
 def create(org_label, project_label, description=None, api_mappings=None, vocab=None, base=None):
@@ -45,9 +54,7 @@ def create(org_label, project_label, description=None, api_mappings=None, vocab=
     :return: The payload from the Nexus API as a dictionary. This contains the Nexus metadata of the project
     """
 
-    org_label = url_encode(org_label)
-    project_label = url_encode(project_label)
-    path = "/projects/" + org_label + "/" + project_label
+    path = _project_path(url_encode(org_label), url_encode(project_label))
 
     config = {}
 
@@ -63,7 +70,10 @@ def create(org_label, project_label, description=None, api_mappings=None, vocab=
     if base is not None:
         config["base"] = base
 
-    return http_put(path, use_base=True, body=config)
+    try:
+        return http_put(path, use_base=True, body=config)
+    finally:
+        fetch_cache.invalidate(path)
 
 
 def update(project, rev=None):
@@ -81,12 +91,12 @@ def update(project, rev=None):
     if rev is None:
         rev = project["_rev"]
 
-    org_label = url_encode(project["_organizationLabel"])
-    project_label = url_encode(project["_label"])
-
-    path = "/projects/" + org_label + "/" + project_label + "?rev=" + str(rev)
+    resource = _project_path(url_encode(project["_organizationLabel"]), url_encode(project["_label"]))
 
-    return http_put(path, project, use_base=True)
+    try:
+        return http_put(resource + "?rev=" + str(rev), project, use_base=True)
+    finally:
+        fetch_cache.invalidate(resource)
 
 
 def list(org_label=None, pagination_from=0, pagination_size=20, deprecated=None, full_text_search_query=None):
@@ -107,20 +117,35 @@ def list(org_label=None, pagination_from=0, pagination_size=20, deprecated=None,
     path = "/projects"
 
     if org_label is not None:
-        org_label = url_encode(org_label)
-        path = path + "/" + org_label
+        path = "/projects/" + url_encode(org_label)
 
-    path = path + "?from=" + str(pagination_from) + "&size=" + str(pagination_size)
+    query = ["from=" + str(pagination_from), "size=" + str(pagination_size)]
 
     if deprecated is not None:
-        deprecated = "true" if deprecated else "false"
-        path = path + "&deprecated=" + deprecated
+        query.append("deprecated=true" if deprecated else "deprecated=false")
 
     if full_text_search_query is not None:
-        full_text_search_query = url_encode(full_text_search_query)
-        path = path + "&q=" + full_text_search_query
+        query.append("q=" + url_encode(full_text_search_query))
 
-    return http_get(path, use_base=True)
+    return http_get(path + "?" + "&".join(query), use_base=True)
+
+
+def list_all(org_label=None, deprecated=None, full_text_search_query=None, page_size=100, max_workers=8):
+    """
+    Iterate over all the projects, going through all the pages of the listing. The pages after the first one are
+    fetched concurrently. The arguments are the same as for `list(...)`, without the pagination.
+
+    :param org_label: OPTIONAL get only the projects of this given organization
+    :param deprecated: OPTIONAL Lists only the deprecated if True,
+        lists only the non-deprecated if False,
+        lists everything if not provided or None (default: None)
+    :param full_text_search_query: OPTIONAL List only the projects that match this query
+    :param page_size: OPTIONAL Number of projects fetched per request (default: 100)
+    :param max_workers: OPTIONAL Maximum number of pages fetched at the same time (default: 8)
+    :return: iterator of the projects payloads, in the same order as `list(...)`
+    """
+    return paginate(list, page_size, max_workers, org_label=org_label, deprecated=deprecated,
+                    full_text_search_query=full_text_search_query)
 
 
 def deprecate_2(org_label, project_label, rev):
@@ -136,12 +161,12 @@ def deprecate_2(org_label, project_label, rev):
     :return: The payload from the Nexus API as a dictionary. This contains the Nexus metadata of the project
     """
 
-    org_label = url_encode(org_label)
-    project_label = url_encode(project_label)
-
-    path = "/projects/" + org_label + "/" + project_label + "?rev=" + str(rev)
+    resource = _project_path(url_encode(org_label), url_encode(project_label))
 
-    return http_delete(path, use_base=True)
+    try:
+        return http_delete(resource + "?rev=" + str(rev), use_base=True)
+    finally:
+        fetch_cache.invalidate(resource)
 
 
 def deprecate(project, rev=None):
@@ -156,15 +181,15 @@ def deprecate(project, rev=None):
     :return: The payload from the Nexus API as a dictionary. This contains the Nexus metadata of the project
     """
 
-    org_label = url_encode(project["_organizationLabel"])
-    project_label = url_encode(project["_label"])
-
     if rev is None:
         rev = project["_rev"]
 
-    path = "/projects/" + org_label + "/" + project_label + "?rev=" + str(rev)
+    resource = _project_path(url_encode(project["_organizationLabel"]), url_encode(project["_label"]))
 
-    return http_delete(path, use_base=True)
+    try:
+        return http_delete(resource + "?rev=" + str(rev), use_base=True)
+    finally:
+        fetch_cache.invalidate(resource)
 
 
 def events(last_id: Optional[str] = None):
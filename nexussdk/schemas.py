@@ -3,11 +3,18 @@ Using schemas is a way to ensure your data to follow a set of rules.
 """
 
 import json
-from nexussdk.utils.http import http_get
-from nexussdk.utils.http import http_put
-from nexussdk.utils.http import http_post
-from nexussdk.utils.http import http_delete
-from urllib.parse import quote_plus as url_encode
+from nexussdk.utils.http import http_delete, http_get, http_post, http_put, url_encode
+from nexussdk.utils.batch import paginate, run_concurrently
+from nexussdk.utils.cache import fetch_cache
+
+__all__ = ["list", "list_all", "fetch", "create", "update", "deprecate", "tag", "tag_many"]
+
+# paths of the schemas of a project and of a schema, from their URL-encoded labels and id
+_schemas_path = "/schemas/{}/{}".format
+_schema_path = "/schemas/{}/{}/{}".format
+# URLs of a revision of a schema and of its tags, from its _self URL and the revision
+_rev_url = "{}?rev={}".format
+_tags_url = "{}/tags?rev={}".format
 
 
 def list(org_label, project_label, pagination_from=0, pagination_size=20,
@@ -26,22 +33,35 @@ def list(org_label, project_label, pagination_from=0, pagination_size=20,
     :return: List of schema and some Nexus metadata
     """
 
-    org_label = url_encode(org_label)
-    project_label = url_encode(project_label)
+    path = _schemas_path(url_encode(org_label), url_encode(project_label))
 
-    path = "/schemas/" + org_label + "/" + project_label
-
-    path = path + "?from=" + str(pagination_from) + "&size=" + str(pagination_size)
+    query = ["from=" + str(pagination_from), "size=" + str(pagination_size)]
 
     if deprecated is not None:
-        deprecated = "true" if deprecated else "false"
-        path = path + "&deprecated=" + deprecated
+        query.append("deprecated=true" if deprecated else "deprecated=false")
 
     if full_text_search_query:
-        full_text_search_query = url_encode(full_text_search_query)
-        path = path + "&q=" + full_text_search_query
+        query.append("q=" + url_encode(full_text_search_query))
+
+    return http_get(path + "?" + "&".join(query), use_base=True)
 
-    return http_get(path, use_base=True)
+
+def list_all(org_label, project_label, deprecated=None, full_text_search_query=None, page_size=100, max_workers=8):
+    """
+    Iterate over all the schemas available, going through all the pages of the listing. The pages after the first
+    one are fetched concurrently. The arguments are the same as for `list(...)`, without the pagination.
+
+    :param org_label: Label of the organization to which listing the schema
+    :param project_label: Label of the project to which listing the schema
+    :param deprecated:  OPTIONAL Get only deprecated resource if True and get only non-deprecated results if False.
+        If not specified (default), return both deprecated and not deprecated resource.
+    :param full_text_search_query: A string to look for as a full text query
+    :param page_size: OPTIONAL Number of schemas fetched per request (default: 100)
+    :param max_workers: OPTIONAL Maximum number of pages fetched at the same time (default: 8)
+    :return: iterator of the schemas payloads, in the same order as `list(...)`
+    """
+    return paginate(list, page_size, max_workers, org_label=org_label, project_label=project_label,
+                    deprecated=deprecated, full_text_search_query=full_text_search_query)
 
 
 def fetch(org_label, project_label, schema_id, rev=None, tag=None):
@@ -60,10 +80,13 @@ def fetch(org_label, project_label, schema_id, rev=None, tag=None):
     if rev is not None and tag is not None:
         raise Exception("The arguments rev and tag are mutually exclusive. One or the other must be chosen.")
 
-    org_label = url_encode(org_label)
-    project_label = url_encode(project_label)
-    schema_id = url_encode(schema_id)
-    path = "/schemas/" + org_label + "/" + project_label + "/" + schema_id
+    path = _schema_path(url_encode(org_label), url_encode(project_label), url_encode(schema_id))
+    cache_key = (path, rev, tag)
+
+    cached = fetch_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    generation = fetch_cache.generation
 
     if rev is not None:
         path = path + "?rev=" + str(rev)
@@ -71,7 +94,10 @@ def fetch(org_label, project_label, schema_id, rev=None, tag=None):
     if tag is not None:
         path = path + "?tag=" + str(tag)
 
-    return http_get(path, use_base=True)
+    payload = http_get(path, use_base=True)
+    # a tag can be moved to another revision, only a revision number pins the payload
+    fetch_cache.set(cache_key, payload, pinned=rev is not None, generation=generation)
+    return payload
 
 
 def create(org_label, project_label, schema_obj, schema_id=None):
@@ -91,16 +117,16 @@ def create(org_label, project_label, schema_obj, schema_id=None):
     if (not isinstance(schema_obj, dict)) and isinstance(schema_obj, str):
         schema_obj = json.loads(schema_obj)
 
-    org_label = url_encode(org_label)
-    project_label = url_encode(project_label)
-    path = "/schemas/" + org_label + "/" + project_label
+    path = _schemas_path(url_encode(org_label), url_encode(project_label))
 
     if schema_id is None:
         return http_post(path, schema_obj, use_base=True)
     else:
-        schema_id = url_encode(schema_id)
-        path = path + "/" + schema_id
-        return http_put(path, schema_obj, use_base=True)
+        path = path + "/" + url_encode(schema_id)
+        try:
+            return http_put(path, schema_obj, use_base=True)
+        finally:
+            fetch_cache.invalidate(path)
 
 
 def update(schema, rev=None):
@@ -116,12 +142,15 @@ def update(schema, rev=None):
     :return: A payload containing only the Nexus metadata for this updated schema.
     """
 
+    self_url = _self_url(schema)
+
     if rev is None:
         rev = schema["_rev"]
 
-    path = schema["_self"] + "?rev=" + str(rev)
-
-    return http_put(path, schema, use_base=False)
+    try:
+        return http_put(_rev_url(self_url, rev), schema, use_base=False)
+    finally:
+        fetch_cache.invalidate(self_url)
 
 
 def deprecate(schema, rev=None):
@@ -135,12 +164,15 @@ def deprecate(schema, rev=None):
     :return: A payload containing only the Nexus metadata for this deprecated schema.
     """
 
+    self_url = _self_url(schema)
+
     if rev is None:
         rev = schema["_rev"]
 
-    path = schema["_self"] + "?rev=" + str(rev)
-
-    return http_delete(path, use_base=False)
+    try:
+        return http_delete(_rev_url(self_url, rev), use_base=False)
+    finally:
+        fetch_cache.invalidate(self_url)
 
 
 def tag(schema, tag_value, rev_to_tag=None, rev=None):
@@ -156,17 +188,42 @@ def tag(schema, tag_value, rev_to_tag=None, rev=None):
     :return: A payload containing only the Nexus metadata for this schema.
     """
 
-    if rev is None:
-        rev = schema["_rev"]
-
-    if rev_to_tag is None:
-        rev_to_tag = schema["_rev"]
+    self_url = _self_url(schema)
 
-    path = schema["_self"] + "/tags?rev=" + str(rev)
+    # the payload is only required to have a _rev when one of the revisions is not given
+    if rev is None or rev_to_tag is None:
+        last_rev = schema["_rev"]
+        rev = last_rev if rev is None else rev
+        rev_to_tag = last_rev if rev_to_tag is None else rev_to_tag
 
     data = {
         "tag": tag_value,
         "rev": rev_to_tag
     }
 
-    return http_put(path, body=data, use_base=False)
+    try:
+        return http_put(_tags_url(self_url, rev), body=data, use_base=False)
+    finally:
+        fetch_cache.invalidate(self_url)
+
+
+def tag_many(schemas, tag_value, max_workers=16):
+    """
+    Add the same tag to many schemas, each at the revision of its payload. The requests are sent concurrently.
+
+    :param schemas: list of payloads of previously fetched schemas
+    :param tag_value: The value (or name) of a tag
+    :param max_workers: OPTIONAL Maximum number of requests sent at the same time (default: 16)
+    :return: The payloads containing only the Nexus metadata of the schemas, in the same order as `schemas`.
+        If tagging a schema failed, its exception (e.g. a nexussdk.HTTPError) is at its index instead.
+    """
+    return run_concurrently(tag, [(schema, tag_value) for schema in schemas], max_workers)
+
+
+# Internal helpers
+
+def _self_url(schema):
+    self_url = schema.get("_self")
+    if self_url is None:
+        raise Exception("The schema payload has no _self, it is expected to come from fetch().")
+    return self_url
@@ -0,0 +1,118 @@
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+
+def paginate(list_function: Callable, page_size: int = 100, max_workers: int = 8, **kwargs) -> Iterator[Dict]:
+    """
+        Go through all the pages of a Nexus listing and yield its results, in the order of the listing.
+        The first page is fetched to know the total number of results, then all the remaining pages are
+        fetched concurrently over the shared HTTP session.
+
+        :param list_function: a listing function accepting the arguments pagination_from and pagination_size,
+        such as projects.list or schemas.list
+        :param page_size: OPTIONAL Number of results fetched per request (default: 100)
+        :param max_workers: OPTIONAL Maximum number of pages fetched at the same time (default: 8)
+        :param kwargs: the other arguments to give to list_function
+        :return: iterator of the results of the listing
+    """
+    # imported here as only a few scripts need it, most of the SDK users never do
+    from concurrent.futures import ThreadPoolExecutor
+
+    first_page = list_function(pagination_from=0, pagination_size=page_size, **kwargs)
+    yield from first_page.get("_results", [])
+
+    offsets = range(page_size, first_page["_total"], page_size)
+    if not offsets:
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(list_function, pagination_from=offset, pagination_size=page_size, **kwargs)
+                   for offset in offsets]
+        try:
+            for future in futures:
+                yield from future.result().get("_results", [])
+        finally:
+            # the consumer may stop iterating early, the pages not fetched yet are not needed anymore
+            for future in futures:
+                future.cancel()
+
+
+def run_concurrently(function: Callable, arguments: Iterable[Tuple], max_workers: int = 16) -> List:
+    """
+        Call a function once for each tuple of arguments, concurrently over the shared HTTP session.
+
+        :param function: the function to call, such as acls.replace or schemas.tag
+        :param arguments: the positional arguments of each call, as tuples
+        :param max_workers: OPTIONAL Maximum number of calls running at the same time (default: 16)
+        :return: the results of the calls, in the same order as arguments. If a call failed, its exception is
+        returned at its index instead of a result, so that the calls which succeeded are still known
+    """
+    with Pipeline(max_workers) as calls:
+        for args in arguments:
+            calls.submit(function, *args)
+    return calls.results(return_exceptions=True)
+
+
+class Pipeline:
+    """
+        Sends SDK calls concurrently over the shared HTTP session, instead of waiting for each response before
+        sending the next request. Use it through nexus.pipeline():
+
+            with nexus.pipeline() as calls:
+                for schema in my_schemas:
+                    calls.submit(nexus.schemas.update, schema)
+            results = calls.results(return_exceptions=True)
+
+        Leaving the `with` block waits for all the submitted calls to complete.
+    """
+
+    def __init__(self, max_workers: int = 16):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._futures = []
+
+    def submit(self, function: Callable, *args, **kwargs):
+        """
+            Start a call.
+
+            :param function: the SDK function to call
+            :param args: its positional arguments
+            :param kwargs: its keyword arguments
+            :return: a concurrent.futures.Future of the result of the call
+        """
+        future = self._executor.submit(function, *args, **kwargs)
+        self._futures.append(future)
+        return future
+
+    def results(self, return_exceptions: bool = False) -> List:
+        """
+            Wait for the calls and get their results.
+
+            :param return_exceptions: OPTIONAL If True, the exception of a failed call is returned at its index,
+            in place of its result. If False, the first exception (in the order of submission) is raised and the
+            other results are lost (default: False)
+            :return: the results of the calls, in the order in which they were submitted
+        """
+        if not return_exceptions:
+            return [future.result() for future in self._futures]
+        results = []
+        for future in self._futures:
+            exception = future.exception()
+            results.append(future.result() if exception is None else exception)
+        return results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._executor.shutdown(wait=True)
+
+
+def pipeline(max_workers: int = 16) -> Pipeline:
+    """
+        Create a pipeline to send many SDK calls concurrently, see Pipeline.
+
+        :param max_workers: OPTIONAL Maximum number of calls running at the same time (default: 16)
+        :return: the pipeline, to use as a context manager
+    """
+    return Pipeline(max_workers)
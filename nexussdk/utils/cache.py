@@ -0,0 +1,89 @@
+import collections
+import copy
+import threading
+import time
+from typing import Dict, Hashable, Optional
+
+
+class FetchCache:
+    """
+        Bounded cache for the payloads returned by the fetch functions.
+
+        The entries are keyed by a tuple whose first element is the path of the fetched entity (without the query).
+        The entries for a pinned revision never expire, as a revision cannot change. The others are only cached
+        when `ttl` is set (it is 0 by default) and expire after `ttl` seconds. The least recently used entries are
+        dropped when there are more than `maxsize` of them.
+    """
+
+    def __init__(self, maxsize=1024, ttl=0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        # incremented by each invalidation, see set()
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """
+            To read before sending the request whose payload will be cached, and to give to set().
+        """
+        return self._generation
+
+    def get(self, key: Hashable) -> Optional[Dict]:
+        """
+            :param key: key of the entry
+            :return: a copy of the cached payload, or None if it is not cached or has expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expiry, payload = entry
+            if expiry is not None and expiry < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        # the callers are free to modify what they got, it must not alter the cache
+        return copy.deepcopy(payload)
+
+    def set(self, key: Hashable, payload: Dict, pinned=False, generation: Optional[int] = None):
+        """
+            :param key: key of the entry
+            :param payload: the payload to cache, a copy of it is stored
+            :param pinned: OPTIONAL True if the payload is for a specific revision and cannot change (default: False)
+            :param generation: OPTIONAL The generation read before fetching the payload. If an invalidation happened
+                since, the payload may predate a write and is not cached (default: None, always cached)
+        """
+        if not pinned and not self.ttl:
+            return
+        expiry = None if pinned else time.monotonic() + self.ttl
+        payload = copy.deepcopy(payload)
+        with self._lock:
+            if not pinned and generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (expiry, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, resource: str):
+        """
+            Drop all the entries of an entity, whatever their revision or tag.
+
+            :param resource: the path of the entity, as used in the keys, or its `_self` URL
+        """
+        with self._lock:
+            self._generation += 1
+            stale = [key for key, (_, payload) in self._entries.items()
+                     if key[0] == resource or payload.get("_self") == resource]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+fetch_cache = FetchCache()
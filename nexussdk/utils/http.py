@@ -1,8 +1,12 @@
 import json
 import collections
+import functools
+import gzip
 import requests
-from sseclient import SSEClient
-from typing import List, Union, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import List, Optional, Tuple, Union
+from urllib.parse import quote_plus
 from nexussdk.utils.store import storage
 
 # to make sure the output response dictionary are always ordered like the response's json
@@ -26,6 +30,28 @@ header_accept = {
 default_type = "json"
 header_parts["default"] = header_parts[default_type]
 
+# a single session is shared by all the requests so that the connections to Nexus are kept alive and reused,
+# instead of paying a new TCP (and TLS) handshake for every call.
+# The connection errors are retried for all the requests, as they could not have reached Nexus. The read errors
+# (e.g. a kept-alive connection closed by the server) are only retried for GET and HEAD: a write (PUT, DELETE...
+# with ?rev=) sent again may have been applied already, and would then fail with a 409.
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                       max_retries=Retry(total=3, allowed_methods=frozenset({"GET", "HEAD"})))
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+# the labels and ids being URL-encoded are mostly the same few org and project labels, over and over
+url_encode = functools.lru_cache(maxsize=4096)(quote_plus)
+
+
+class NexusHTTPError(requests.exceptions.HTTPError):
+    """
+        Raised when Nexus answers with an error status. Its message contains the body of the response,
+        where Nexus explains the reason of the error. As a subclass of requests' HTTPError, it is also
+        caught by `except nexussdk.HTTPError`.
+    """
+
 
 def prepare_header(type="default", accept="json"):
     """
@@ -52,7 +78,7 @@ def prepare_body(data, type="default"):
     """
         Prepare the body of the HTTP request
 
-        :param data:
+        :param data: the body, a JSON body can also be given already serialized as bytes (see encode_json)
         :param type:
         :return:
     """
@@ -60,7 +86,7 @@ def prepare_body(data, type="default"):
         type = default_type
     body = None
 
-    if type == "json":
+    if type == "json" and not isinstance(data, bytes):
         body = json.dumps(data, ensure_ascii=True)
     else:
         body = data
@@ -71,6 +97,16 @@ def prepare_body(data, type="default"):
     return body
 
 
+def encode_json(data) -> bytes:
+    """
+        Serialize a JSON body to bytes, to give it already serialized to the http_* functions.
+
+        :param data: the body, as a dictionary
+        :return: the JSON body as bytes
+    """
+    return json.dumps(data, ensure_ascii=True).encode("ascii")
+
+
 def print_request_response(r):
     print("status: ", r.status_code)
     print("encoding: ", r.encoding)
@@ -83,7 +119,7 @@ def print_request_response(r):
     print("history: ", r.history)
 
 
-def http_get(path: Union[str, List[str]], stream=False, get_raw_response=False, use_base=False,
+def http_get(path: Union[str, List[str], Tuple[str, ...]], stream=False, get_raw_response=False, use_base=False,
              data_type="default", accept="json", **kwargs):
     """
         Wrapper to perform a GET request.
@@ -96,25 +132,30 @@ def http_get(path: Union[str, List[str]], stream=False, get_raw_response=False,
         (convenient when getting a binary file). If False, a dictionary representation of the response will be returned
         (default: False)
         :param stream: OPTIONAL True if GETting a file (default: False)
-        :return: if get_raw_response is True, returns the request.get object. If get_raw_response is False, return the
-        dictionary that is equivalent to the json response
+        :return: if get_raw_response is True, returns the requests.Response object. If get_raw_response is False,
+        return the dictionary that is equivalent to the json response
     """
     header = prepare_header(data_type, accept)
     full_url = _full_url(path, use_base)
     params = kwargs.pop("params", None)
     if params:
-        response = requests.get(full_url, headers=header, stream=stream, params=params, **kwargs)
+        response = _session.request("GET", full_url, headers=header, stream=stream, params=params, **kwargs)
     else:
-        response = requests.get(full_url, headers=header, stream=stream, params=kwargs)
-    response.raise_for_status()
+        response = _session.request("GET", full_url, headers=header, stream=stream, params=kwargs)
 
-    if get_raw_response:
-        return response
-    else:
-        return decode_json_ordered(response.text)
+    if not get_raw_response:
+        return _check_and_parse(response)
 
+    if response.status_code >= 400:
+        _raise_for(response)
 
-def http_post(path: Union[str, List[str]], body=None, data_type="default", use_base=False, **kwargs):
+    # Nexus JSON is always UTF-8, but requests would guess the encoding of application/ld+json with chardet
+    if response.encoding is None and "json" in response.headers.get("Content-Type", ""):
+        response.encoding = "utf-8"
+    return response
+
+
+def http_post(path: Union[str, List[str], Tuple[str, ...]], body=None, data_type="default", use_base=False, **kwargs):
     """
         Perform a POST request.
 
@@ -128,21 +169,20 @@ def http_post(path: Union[str, List[str]], body=None, data_type="default", use_b
     full_url = _full_url(path, use_base)
 
     # body_data = prepare_body(body, data_type)
-    # response = requests.post(full_url, headers=header, data=body_data, params=kwargs)
+    # response = _session.request("POST", full_url, headers=header, data=body_data, params=kwargs)
 
     response = None
 
     if data_type != "file":
-        body_data = prepare_body(body, data_type)
-        response = requests.post(full_url, headers=header, data=body_data, params=kwargs)
+        body_data = _compress(prepare_body(body, data_type), header)
+        response = _session.request("POST", full_url, headers=header, data=body_data, params=kwargs)
     else:
-        response = requests.post(full_url, headers=header, files=body, params=kwargs)
+        response = _session.request("POST", full_url, headers=header, files=body, params=kwargs)
 
-    response.raise_for_status()
-    return decode_json_ordered(response.text)
+    return _check_and_parse(response)
 
 
-def http_put(path: Union[str, List[str]], body=None, data_type="default", use_base=False, **kwargs):
+def http_put(path: Union[str, List[str], Tuple[str, ...]], body=None, data_type="default", use_base=False, **kwargs):
     """
         Performs a PUT request
 
@@ -160,16 +200,15 @@ def http_put(path: Union[str, List[str]], body=None, data_type="default", use_ba
     response = None
 
     if data_type != "file":
-        body_data = prepare_body(body, data_type)
-        response = requests.put(full_url, headers=header, data=body_data, params=kwargs)
+        body_data = _compress(prepare_body(body, data_type), header)
+        response = _session.request("PUT", full_url, headers=header, data=body_data, params=kwargs)
     else:
-        response = requests.put(full_url, headers=header, files=body, params=kwargs)
+        response = _session.request("PUT", full_url, headers=header, files=body, params=kwargs)
 
-    response.raise_for_status()
-    return decode_json_ordered(response.text)
+    return _check_and_parse(response)
 
 
-def http_patch(path: Union[str, List[str]], body=None, data_type="default", use_base=False, **kwargs):
+def http_patch(path: Union[str, List[str], Tuple[str, ...]], body=None, data_type="default", use_base=False, **kwargs):
     """
         Performs a PATCH request
 
@@ -183,13 +222,12 @@ def http_patch(path: Union[str, List[str]], body=None, data_type="default", use_
     """
     header = prepare_header()
     full_url = _full_url(path, use_base)
-    body_data = prepare_body(body, data_type)
-    response = requests.patch(full_url, headers=header, data=body_data, params=kwargs)
-    response.raise_for_status()
-    return decode_json_ordered(response.text)
+    body_data = _compress(prepare_body(body, data_type), header)
+    response = _session.request("PATCH", full_url, headers=header, data=body_data, params=kwargs)
+    return _check_and_parse(response)
 
 
-def http_delete(path: Union[str, List[str]], body=None, data_type="default", use_base=False, **kwargs):
+def http_delete(path: Union[str, List[str], Tuple[str, ...]], body=None, data_type="default", use_base=False, **kwargs):
     """
         Performs a DELETE request
 
@@ -204,9 +242,8 @@ def http_delete(path: Union[str, List[str]], body=None, data_type="default", use
     header = prepare_header()
     full_url = _full_url(path, use_base)
     body_data = prepare_body(body, data_type)
-    response = requests.delete(full_url, headers=header, data=body_data, params=kwargs)
-    response.raise_for_status()
-    return decode_json_ordered(response.text)
+    response = _session.request("DELETE", full_url, headers=header, data=body_data, params=kwargs)
+    return _check_and_parse(response)
 
 
 def sse_request(path: str, last_id: Optional[str], ):
@@ -218,7 +255,9 @@ def sse_request(path: str, last_id: Optional[str], ):
                 the event with the provided ID will be returned.
         :return: iterator of SSE events
     """
-    return SSEClient(_full_url(path, True), last_id, headers=prepare_header())
+    # imported here so that only the users of the events pay for it
+    from sseclient import SSEClient
+    return SSEClient(_full_url(path, True), last_id, session=_session, headers=prepare_header())
 
 
 def is_response_valid(response):
@@ -232,15 +271,60 @@ def is_response_valid(response):
 
 
 # Internal helpers
-def _full_url(path: Union[str, List[str]], use_base: bool) -> str:
+def _compress(body, header):
+    """
+        Compress the body of the HTTP request with gzip, if enabled with nexus.config.enable_request_compression
+        and if the body is big enough to be worth it.
+
+        :param body: the body, as returned by prepare_body
+        :param header: the header of the request, Content-Encoding is added to it when the body is compressed
+        :return: the body to send
+    """
+    if not storage.has("request_compression") or not isinstance(body, (str, bytes)):
+        return body
+
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+
+    if len(body) < storage.get("request_compression"):
+        return body
+
+    header["Content-Encoding"] = "gzip"
+    return gzip.compress(body)
+
+
+def _check_and_parse(response):
+    # the single place where the responses of the http_* functions are checked and decoded
+    if response.status_code >= 400:
+        _raise_for(response)
+    return _loads(response.content)
+
+
+def _loads(content: bytes):
+    # orjson is faster but turns the integers wider than 64 bits into floats, so it is only used when
+    # explicitly enabled with nexus.config.enable_fast_json_parsing
+    if storage.has("fast_json_parsing"):
+        import orjson
+        return orjson.loads(content)
+    # decoded as UTF-8 directly, without going through response.text and its charset detection
+    # (json.loads only accepts bytes since Python 3.6)
+    return decode_json_ordered(content.decode("utf-8"))
+
+
+def _raise_for(response):
+    # the message is only built here, once a request actually failed
+    raise NexusHTTPError("Invalid http request for {} (Status {})\n{}".format(
+        response.url, response.status_code, response.content.decode("utf-8", "replace")), response=response)
+
+
+def _full_url(path: Union[str, List[str], Tuple[str, ...]], use_base: bool) -> str:
     # 'use_base' is temporary for compatibility with previous code sections.
     if use_base:
         return storage.get("environment") + path
 
     if isinstance(path, str):
         return path
-    elif isinstance(path, list):
-        url = [storage.get("environment")] + path
-        return "/".join(url)
+    elif isinstance(path, (list, tuple)):
+        return "/".join((storage.get("environment"), *path))
     else:
-        raise TypeError("Expecting a string or a list!")
+        raise TypeError("Expecting a string, a list or a tuple!")
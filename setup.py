@@ -28,6 +28,7 @@ setup(
     extras_require={
         "test": ["pytest", "pytest-cov"],
         "doc": ["sphinx"],
+        "speedups": ["orjson", "brotli"],
     },
     data_files=[("", ["LICENSE.txt"])],
     classifiers=[
@@ -0,0 +1,24 @@
+import json
+
+from nexussdk import acls
+
+IDENTITY = {"@type": "User", "realm": "bbp", "subject": "alice"}
+
+
+def test_body_is_the_serialized_payload():
+    body = acls._body([["projects/read"]], [IDENTITY], "Append")
+    assert json.loads(body) == acls._payload([["projects/read"]], [IDENTITY], "Append")
+
+
+def test_body_serializes_the_arguments_as_given():
+    # a string instead of a list of permissions must not become a list of characters
+    body = acls._body(["projects/read"], [IDENTITY])
+    assert json.loads(body)["acl"][0]["permissions"] == "projects/read"
+
+
+def test_body_does_not_mix_equal_values_of_other_types():
+    as_bool = acls._body([["projects/read"]], [{"@type": "User", "flag": True}])
+    as_int = acls._body([["projects/read"]], [{"@type": "User", "flag": 1}])
+    assert json.loads(as_bool)["acl"][0]["identity"]["flag"] is True
+    assert json.loads(as_int)["acl"][0]["identity"]["flag"] == 1
+    assert as_bool != as_int
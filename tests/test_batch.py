@@ -0,0 +1,88 @@
+import threading
+import time
+
+import pytest
+
+from nexussdk.utils.batch import paginate, pipeline, run_concurrently
+
+ITEMS = list(range(95))
+
+
+def fake_list(calls, release=None):
+    def list_function(pagination_from, pagination_size, **kwargs):
+        calls.append((pagination_from, kwargs))
+        if release is not None and pagination_from >= 2 * pagination_size:
+            release.wait(timeout=1)
+        return {"_total": len(ITEMS), "_results": ITEMS[pagination_from:pagination_from + pagination_size]}
+    return list_function
+
+
+def test_paginate_keeps_the_listing_order():
+    calls = []
+    assert list(paginate(fake_list(calls), page_size=10, max_workers=4, org_label="o")) == ITEMS
+    assert sorted(offset for offset, _ in calls) == list(range(0, 95, 10))
+    assert all(kwargs == {"org_label": "o"} for _, kwargs in calls)
+
+
+def test_paginate_single_page():
+    calls = []
+    assert list(paginate(fake_list(calls), page_size=100)) == ITEMS
+    assert calls == [(0, {})]
+
+
+def test_paginate_cancels_the_pending_pages_on_break():
+    calls = []
+    release = threading.Event()
+    results = paginate(fake_list(calls, release), page_size=10, max_workers=1)
+    for item in results:
+        if item == 10:
+            break
+    # stopping the iteration cancels the pages which have not started yet
+    results.close()
+    release.set()
+    offsets = [offset for offset, _ in calls]
+    # the page after the one being read may have been running already, none of the others were fetched
+    assert offsets[:2] == [0, 10]
+    assert offsets[2:] in ([], [20])
+
+
+def slow_identity(value, delay):
+    time.sleep(delay)
+    return value
+
+
+def fail_on(value, failing):
+    if value == failing:
+        raise ValueError(value)
+    return value
+
+
+def test_pipeline_results_in_submission_order():
+    with pipeline(max_workers=4) as calls:
+        # the first calls submitted are the last ones to complete
+        for value in range(4):
+            calls.submit(slow_identity, value, delay=0.04 * (4 - value))
+    assert calls.results() == [0, 1, 2, 3]
+
+
+def test_pipeline_results_raises_the_first_failure():
+    with pipeline() as calls:
+        for value in range(3):
+            calls.submit(fail_on, value, 1)
+    with pytest.raises(ValueError):
+        calls.results()
+
+
+def test_pipeline_results_return_exceptions():
+    with pipeline() as calls:
+        for value in range(3):
+            calls.submit(fail_on, value, 1)
+    results = calls.results(return_exceptions=True)
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], ValueError)
+
+
+def test_run_concurrently_keeps_the_results_around_a_failure():
+    results = run_concurrently(fail_on, [(value, 1) for value in range(3)])
+    assert results[0] == 0 and results[2] == 2
+    assert isinstance(results[1], ValueError)
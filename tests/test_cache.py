@@ -0,0 +1,88 @@
+from nexussdk.utils import cache
+from nexussdk.utils.cache import FetchCache
+
+
+def test_latest_not_cached_by_default():
+    fetch_cache = FetchCache()
+    fetch_cache.set(("/projects/o/p", None), {"_rev": 1})
+    assert fetch_cache.get(("/projects/o/p", None)) is None
+
+
+def test_pinned_revision_cached_by_default():
+    fetch_cache = FetchCache()
+    fetch_cache.set(("/projects/o/p", 1), {"_rev": 1}, pinned=True)
+    assert fetch_cache.get(("/projects/o/p", 1)) == {"_rev": 1}
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    fetch_cache = FetchCache(ttl=60)
+    fetch_cache.set(("/projects/o/p", None), {"_rev": 1})
+    fetch_cache.set(("/projects/o/p", 1), {"_rev": 1}, pinned=True)
+
+    now[0] += 59
+    assert fetch_cache.get(("/projects/o/p", None)) == {"_rev": 1}
+
+    now[0] += 2
+    assert fetch_cache.get(("/projects/o/p", None)) is None
+    assert fetch_cache.get(("/projects/o/p", 1)) == {"_rev": 1}
+
+
+def test_lru_eviction():
+    fetch_cache = FetchCache(maxsize=2)
+    fetch_cache.set(("a", 1), {"name": "a"}, pinned=True)
+    fetch_cache.set(("b", 1), {"name": "b"}, pinned=True)
+    # "a" becomes the most recently used, so "b" is evicted
+    fetch_cache.get(("a", 1))
+    fetch_cache.set(("c", 1), {"name": "c"}, pinned=True)
+
+    assert fetch_cache.get(("a", 1)) == {"name": "a"}
+    assert fetch_cache.get(("b", 1)) is None
+    assert fetch_cache.get(("c", 1)) == {"name": "c"}
+
+
+def test_invalidate_by_path():
+    fetch_cache = FetchCache(ttl=60)
+    fetch_cache.set(("/schemas/o/p/s", None, None), {"_rev": 2})
+    fetch_cache.set(("/schemas/o/p/s", 1, None), {"_rev": 1}, pinned=True)
+    fetch_cache.set(("/schemas/o/p/other", None, None), {"_rev": 1})
+
+    fetch_cache.invalidate("/schemas/o/p/s")
+
+    assert fetch_cache.get(("/schemas/o/p/s", None, None)) is None
+    assert fetch_cache.get(("/schemas/o/p/s", 1, None)) is None
+    assert fetch_cache.get(("/schemas/o/p/other", None, None)) == {"_rev": 1}
+
+
+def test_invalidate_by_self():
+    fetch_cache = FetchCache(ttl=60)
+    self_url = "https://nexus.example.com/v1/schemas/o/p/s"
+    fetch_cache.set(("/schemas/o/p/nxv%3As", None, None), {"_self": self_url, "_rev": 2})
+
+    fetch_cache.invalidate(self_url)
+
+    assert fetch_cache.get(("/schemas/o/p/nxv%3As", None, None)) is None
+
+
+def test_set_ignored_after_concurrent_invalidation():
+    fetch_cache = FetchCache(ttl=60)
+    generation = fetch_cache.generation
+    # a write happens while the fetch is in flight
+    fetch_cache.invalidate("/projects/o/p")
+    fetch_cache.set(("/projects/o/p", None), {"_rev": 1}, generation=generation)
+
+    assert fetch_cache.get(("/projects/o/p", None)) is None
+
+
+def test_copy_isolation():
+    fetch_cache = FetchCache(ttl=60)
+    payload = {"_rev": 1, "apiMappings": []}
+    fetch_cache.set(("/projects/o/p", None), payload)
+    payload["apiMappings"].append("set after caching")
+
+    fetched = fetch_cache.get(("/projects/o/p", None))
+    assert fetched == {"_rev": 1, "apiMappings": []}
+
+    fetched["apiMappings"].append("set after fetching")
+    assert fetch_cache.get(("/projects/o/p", None)) == {"_rev": 1, "apiMappings": []}